@@ -1,167 +1,334 @@
 from __future__ import annotations
 
 import os
-import socket
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
-from typing import Dict, List
-from uuid import UUID
+import itertools
+from collections import defaultdict
+from dataclasses import replace
+from typing import Annotated, Dict, FrozenSet, Iterable, List, Set, Tuple, get_args
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
 from fastapi import Query, Path
 from typing import Optional
+import orjson
+from pydantic import BaseModel
 
-from models.person import PersonCreate, PersonRead, PersonUpdate
-from models.address import AddressCreate, AddressRead, AddressUpdate
-from models.allergy import AllergyCreate, AllergyRead, AllergyUpdate
-from models.medication import MedicationCreate, MedicationRead, MedicationUpdate
+from models.person import PersonCreate, PersonFilters, PersonRead, PersonRecord, PersonUpdate
+from models.address import AddressCreate, AddressFilters, AddressRead, AddressRecord, AddressUpdate
+from models.allergy import AllergyCreate, AllergyFilters, AllergyRead, AllergyRecord, AllergyUpdate
+from models.medication import MedicationCreate, MedicationFilters, MedicationRead, MedicationRecord, MedicationUpdate
 from models.health import Health
+from models import UUID_PATTERN, utcnow
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+
+def _resolve_local_ip() -> str:
+    import socket
+
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+
+_local_ip_cache: Optional[str] = None
+
+
+async def _local_ip() -> str:
+    # The host's address doesn't change while the process runs; resolve it once,
+    # on the first /health call rather than at import, to keep worker start-up fast.
+    # The lookup can block on DNS, so it runs in the threadpool, off the event loop.
+    global _local_ip_cache
+    if _local_ip_cache is None:
+        _local_ip_cache = await run_in_threadpool(_resolve_local_ip)
+    return _local_ip_cache
+
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
+# Keyed by the canonical (lowercase, hyphenated) string form of each UUID:
+# str hashing is much cheaper than UUID hashing, and path ids need no UUID parse.
+# Values are slotted dataclass records; the *Read models only describe responses.
+# Handlers run on the event loop and never await between reading and writing a
+# store, so create/PATCH read-modify-write cannot interleave and needs no lock.
+# Keep it that way (or add per-key locking) if an await ever lands in there.
+# -----------------------------------------------------------------------------
+persons: Dict[str, PersonRecord] = {}
+addresses: Dict[str, AddressRecord] = {}
+allergies: Dict[str, AllergyRecord] = {}
+medications: Dict[str, MedicationRecord] = {}
+
+
+
+def _non_nullable(model: type[BaseModel]) -> FrozenSet[str]:
+    return frozenset(
+        name for name, info in model.model_fields.items() if type(None) not in get_args(info.annotation)
+    )
+
+
+# PATCH deltas skip revalidation against the Read model, so an explicit null on
+# any of these fields has to be rejected by hand
+ADDRESS_NON_NULL = _non_nullable(AddressRead)
+PERSON_NON_NULL = _non_nullable(PersonRead)
+ALLERGY_NON_NULL = _non_nullable(AllergyRead)
+MEDICATION_NON_NULL = _non_nullable(MedicationRead)
+
+
+def _changes(update: BaseModel, non_null: FrozenSet[str]) -> Dict[str, object]:
+    """Return the fields the client set, refusing nulls on non-nullable fields."""
+    changes = {k: v for k, v in update if k in update.model_fields_set}
+    nulls = sorted(k for k, v in changes.items() if v is None and k in non_null)
+    if nulls:
+        raise HTTPException(status_code=422, detail=f"Fields may not be null: {', '.join(nulls)}")
+    return changes
+
+
+IdPath = Annotated[str, Path(pattern=UUID_PATTERN)]
+
+# Records (and lists of them) go straight to orjson, which handles dataclasses,
+# UUIDs and dates natively. OPT_UTC_Z keeps the "Z" suffix pydantic emits.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def _orjson_default(obj: object) -> object:
+    # Person records embed AddressBase models; Health is a model too
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: object) -> bytes:
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+def _json(obj: object, status_code: int = 200) -> Response:
+    return Response(_dumps(obj), status_code=status_code, media_type="application/json")
+
+# Echo-less /health bodies only differ by timestamp; probes reuse one for a short window
+HEALTH_CACHE_TTL = 0.5
+_health_cache: Tuple[float, bytes] = (0.0, b"")
+
+# -----------------------------------------------------------------------------
+# Secondary indexes: field -> value -> ids, kept in sync by create/update.
+# Each id also gets a creation sequence number so filtered lists come back in
+# store order, the same as unfiltered ones, regardless of PATCH history.
 # -----------------------------------------------------------------------------
-persons: Dict[UUID, PersonRead] = {}
-addresses: Dict[UUID, AddressRead] = {}
-allergies: Dict[UUID, AllergyRead] = {}
-medications: Dict[UUID, MedicationRead] = {}
+IndexKey = Tuple[str, object]
+Index = Dict[str, Dict[object, Set[str]]]
+
+address_index: Index = defaultdict(lambda: defaultdict(set))
+person_index: Index = defaultdict(lambda: defaultdict(set))
+allergy_index: Index = defaultdict(lambda: defaultdict(set))
+medication_index: Index = defaultdict(lambda: defaultdict(set))
+
+_seq = itertools.count()
+address_order: Dict[str, int] = {}
+person_order: Dict[str, int] = {}
+allergy_order: Dict[str, int] = {}
+medication_order: Dict[str, int] = {}
+
+
+def _keys(pairs: Iterable[IndexKey]) -> Set[IndexKey]:
+    # None never matches a filter (unset query params are skipped), so don't index it
+    return {(field, value) for field, value in pairs if value is not None}
+
+
+def _address_keys(a: AddressRecord) -> Set[IndexKey]:
+    return _keys([
+        ("street", a.street),
+        ("city", a.city),
+        ("state", a.state),
+        ("postal_code", a.postal_code),
+        ("country", a.country),
+    ])
+
+
+def _person_keys(p: PersonRecord) -> Set[IndexKey]:
+    return _keys([
+        ("uni", p.uni),
+        ("first_name", p.first_name),
+        ("last_name", p.last_name),
+        ("email", p.email),
+        ("phone", p.phone),
+        ("birth_date", str(p.birth_date) if p.birth_date else None),
+        *(("city", addr.city) for addr in p.addresses),
+        *(("country", addr.country) for addr in p.addresses),
+    ])
+
+
+def _allergy_keys(a: AllergyRecord) -> Set[IndexKey]:
+    return _keys([
+        ("person_id", str(a.person_id)),
+        ("allergen", a.allergen),
+        ("allergy_type", a.allergy_type),
+        ("severity", a.severity),
+        ("noted_date", str(a.noted_date) if a.noted_date else None),
+    ])
+
+
+def _medication_keys(m: MedicationRecord) -> Set[IndexKey]:
+    return _keys([
+        ("person_id", str(m.person_id)),
+        ("name", m.name),
+        ("frequency", m.frequency),
+        ("is_current", m.is_current),
+        ("start_date", str(m.start_date) if m.start_date else None),
+        ("end_date", str(m.end_date) if m.end_date else None),
+    ])
+
+
+def _reindex(index: Index, obj_id: str, old: Set[IndexKey], new: Set[IndexKey]) -> None:
+    for field, value in old - new:
+        bucket = index[field][value]
+        bucket.discard(obj_id)
+        if not bucket:
+            del index[field][value]
+    for field, value in new - old:
+        index[field][value].add(obj_id)
+
+
+def _query(
+    index: Index, store: Dict[str, object], order: Dict[str, int], filters: Dict[str, object]
+) -> List:
+    """Return stored objects matching every non-None filter, in store order."""
+    active = [(field, value) for field, value in filters.items() if value is not None]
+    if not active:
+        return list(store.values())
+    buckets = []
+    for field, value in active:
+        bucket = index.get(field, {}).get(value)
+        if not bucket:
+            return []
+        buckets.append(bucket)
+    buckets.sort(key=len)
+    smallest, rest = buckets[0], buckets[1:]
+    matched = [obj_id for obj_id in smallest if all(obj_id in b for b in rest)]
+    matched.sort(key=order.__getitem__)
+    return [store[obj_id] for obj_id in matched]
 
 app = FastAPI(
     title="Person/Address API",
     description="Demo FastAPI app using Pydantic v2 models for Person and Address",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
-def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
+async def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        ip_address=await _local_ip(),
         echo=echo,
         path_echo=path_echo
     )
 
 @app.get("/health", response_model=Health)
-def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
-    # Works because path_echo is optional in the model
-    return make_health(echo=echo, path_echo=None)
+async def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
+    global _health_cache
+    if echo is not None:
+        # Works because path_echo is optional in the model
+        return await make_health(echo=echo, path_echo=None)
+    now = time.monotonic()
+    cached_at, body = _health_cache
+    if not body or now - cached_at >= HEALTH_CACHE_TTL:
+        body = _dumps(await make_health(echo=None, path_echo=None))
+        _health_cache = (now, body)
+    return Response(body, media_type="application/json")
 
 @app.get("/health/{path_echo}", response_model=Health)
-def get_health_with_path(
+async def get_health_with_path(
     path_echo: str = Path(..., description="Required echo in the URL path"),
     echo: str | None = Query(None, description="Optional echo string"),
 ):
-    return make_health(echo=echo, path_echo=path_echo)
+    return await make_health(echo=echo, path_echo=path_echo)
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
-def create_address(address: AddressCreate):
-    if address.id in addresses:
+async def create_address(address: AddressCreate):
+    key = str(address.id)
+    if key in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
-
-@app.get("/addresses", response_model=List[AddressRead])
-def list_addresses(
-    street: Optional[str] = Query(None, description="Filter by street"),
-    city: Optional[str] = Query(None, description="Filter by city"),
-    state: Optional[str] = Query(None, description="Filter by state/region"),
-    postal_code: Optional[str] = Query(None, description="Filter by postal code"),
-    country: Optional[str] = Query(None, description="Filter by country"),
-):
-    results = list(addresses.values())
+    addresses[key] = AddressRecord(**dict(address))
+    address_order[key] = next(_seq)
+    _reindex(address_index, key, set(), _address_keys(addresses[key]))
+    return _json(addresses[key], status_code=201)
 
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+@app.get("/addresses", response_model=None, responses={200: {"model": List[AddressRead]}})
+async def list_addresses(filters: Annotated[AddressFilters, Query()]):
+    results = _query(address_index, addresses, address_order, dict(filters))
+    return _json(results)
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
+async def get_address(address_id: IdPath):
+    address_id = address_id.lower()
     if address_id not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return _json(addresses[address_id])
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
+async def update_address(address_id: IdPath, update: AddressUpdate):
+    address_id = address_id.lower()
     if address_id not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    # Both sides are already validated; copy the record with the changed fields
+    previous = addresses[address_id]
+    changes = _changes(update, ADDRESS_NON_NULL)
+    changes["updated_at"] = utcnow()
+    # Build the record and its index keys before touching the store or index
+    record = replace(previous, **changes)
+    old_keys, new_keys = _address_keys(previous), _address_keys(record)
+    addresses[address_id] = record
+    _reindex(address_index, address_id, old_keys, new_keys)
+    return _json(addresses[address_id])
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 @app.post("/persons", response_model=PersonRead, status_code=201)
-def create_person(person: PersonCreate):
-    # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
-    return person_read
-
-@app.get("/persons", response_model=List[PersonRead])
-def list_persons(
-    uni: Optional[str] = Query(None, description="Filter by Columbia UNI"),
-    first_name: Optional[str] = Query(None, description="Filter by first name"),
-    last_name: Optional[str] = Query(None, description="Filter by last name"),
-    email: Optional[str] = Query(None, description="Filter by email"),
-    phone: Optional[str] = Query(None, description="Filter by phone number"),
-    birth_date: Optional[str] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
-    city: Optional[str] = Query(None, description="Filter by city of at least one address"),
-    country: Optional[str] = Query(None, description="Filter by country of at least one address"),
-):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+async def create_person(person: PersonCreate):
+    # Each person gets its own UUID; stored as a PersonRecord
+    record = PersonRecord(**dict(person))
+    key = str(record.id)
+    persons[key] = record
+    person_order[key] = next(_seq)
+    _reindex(person_index, key, set(), _person_keys(record))
+    return _json(record, status_code=201)
+
+@app.get("/persons", response_model=None, responses={200: {"model": List[PersonRead]}})
+async def list_persons(filters: Annotated[PersonFilters, Query()]):
+    # city/country are indexed per embedded address, so they match "at least one address"
+    results = _query(person_index, persons, person_order, dict(filters))
+    return _json(results)
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
+async def get_person(person_id: IdPath):
+    person_id = person_id.lower()
     if person_id not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return _json(persons[person_id])
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
+async def update_person(person_id: IdPath, update: PersonUpdate):
+    person_id = person_id.lower()
     if person_id not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    previous = persons[person_id]
+    changes = _changes(update, PERSON_NON_NULL)
+    changes["updated_at"] = utcnow()
+    record = replace(previous, **changes)
+    old_keys, new_keys = _person_keys(previous), _person_keys(record)
+    persons[person_id] = record
+    _reindex(person_index, person_id, old_keys, new_keys)
+    return _json(persons[person_id])
 
 
 
@@ -170,112 +337,91 @@ def update_person(person_id: UUID, update: PersonUpdate):
 # Allergy endpoints
 # -----------------------------------------------------------------------------
 @app.post("/allergies", response_model=AllergyRead, status_code=201)
-def create_allergy(allergy: AllergyCreate):
+async def create_allergy(allergy: AllergyCreate):
     # Optional FK presence check (safe no-op if persons are empty for demos)
-    if getattr(allergy, "person_id", None) and allergy.person_id not in persons:
+    if getattr(allergy, "person_id", None) and str(allergy.person_id) not in persons:
         # Not fatal for a demo API; feel free to relax to a warning if you prefer
         raise HTTPException(status_code=400, detail="person_id does not exist")
-    if allergy.id in allergies:
+    key = str(allergy.id)
+    if key in allergies:
         raise HTTPException(status_code=400, detail="Allergy with this ID already exists")
-    allergies[allergy.id] = AllergyRead(**allergy.model_dump())
-    return allergies[allergy.id]
-
-@app.get("/allergies", response_model=List[AllergyRead])
-def list_allergies(
-    person_id: Optional[UUID] = Query(None, description="Filter by person_id"),
-    allergen: Optional[str] = Query(None, description="Filter by allergen"),
-    allergy_type: Optional[str] = Query(None, description="Filter by allergy_type"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
-    noted_date: Optional[str] = Query(None, description="Filter by noted_date (YYYY-MM-DD)"),
-):
-    results = list(allergies.values())
-
-    if person_id is not None:
-        results = [a for a in results if a.person_id == person_id]
-    if allergen is not None:
-        results = [a for a in results if a.allergen == allergen]
-    if allergy_type is not None:
-        results = [a for a in results if a.allergy_type == allergy_type]
-    if severity is not None:
-        results = [a for a in results if a.severity == severity]
-    if noted_date is not None:
-        results = [a for a in results if (a.noted_date and str(a.noted_date) == noted_date)]
+    allergies[key] = AllergyRecord(**dict(allergy))
+    allergy_order[key] = next(_seq)
+    _reindex(allergy_index, key, set(), _allergy_keys(allergies[key]))
+    return _json(allergies[key], status_code=201)
 
-    return results
+@app.get("/allergies", response_model=None, responses={200: {"model": List[AllergyRead]}})
+async def list_allergies(filters: Annotated[AllergyFilters, Query()]):
+    results = _query(allergy_index, allergies, allergy_order, dict(filters))
+    return _json(results)
 
 @app.get("/allergies/{allergy_id}", response_model=AllergyRead)
-def get_allergy(allergy_id: UUID):
+async def get_allergy(allergy_id: IdPath):
+    allergy_id = allergy_id.lower()
     if allergy_id not in allergies:
         raise HTTPException(status_code=404, detail="Allergy not found")
-    return allergies[allergy_id]
+    return _json(allergies[allergy_id])
 
 @app.patch("/allergies/{allergy_id}", response_model=AllergyRead)
-def update_allergy(allergy_id: UUID, update: AllergyUpdate):
+async def update_allergy(allergy_id: IdPath, update: AllergyUpdate):
+    allergy_id = allergy_id.lower()
     if allergy_id not in allergies:
         raise HTTPException(status_code=404, detail="Allergy not found")
-    stored = allergies[allergy_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    allergies[allergy_id] = AllergyRead(**stored)
-    return allergies[allergy_id]
+    previous = allergies[allergy_id]
+    changes = _changes(update, ALLERGY_NON_NULL)
+    changes["updated_at"] = utcnow()
+    record = replace(previous, **changes)
+    old_keys, new_keys = _allergy_keys(previous), _allergy_keys(record)
+    allergies[allergy_id] = record
+    _reindex(allergy_index, allergy_id, old_keys, new_keys)
+    return _json(allergies[allergy_id])
 
 # -----------------------------------------------------------------------------
 # Medication endpoints
 # -----------------------------------------------------------------------------
 @app.post("/medications", response_model=MedicationRead, status_code=201)
-def create_medication(med: MedicationCreate):
-    if getattr(med, "person_id", None) and med.person_id not in persons:
+async def create_medication(med: MedicationCreate):
+    if getattr(med, "person_id", None) and str(med.person_id) not in persons:
         raise HTTPException(status_code=400, detail="person_id does not exist")
-    if med.id in medications:
+    key = str(med.id)
+    if key in medications:
         raise HTTPException(status_code=400, detail="Medication with this ID already exists")
-    medications[med.id] = MedicationRead(**med.model_dump())
-    return medications[med.id]
-
-@app.get("/medications", response_model=List[MedicationRead])
-def list_medications(
-    person_id: Optional[UUID] = Query(None, description="Filter by person_id"),
-    name: Optional[str] = Query(None, description="Filter by medication name"),
-    frequency: Optional[str] = Query(None, description="Filter by frequency"),
-    is_current: Optional[bool] = Query(None, description="Filter by current flag"),
-    start_date: Optional[str] = Query(None, description="Filter by exact start_date (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="Filter by exact end_date (YYYY-MM-DD)"),
-):
-    results = list(medications.values())
-
-    if person_id is not None:
-        results = [m for m in results if m.person_id == person_id]
-    if name is not None:
-        results = [m for m in results if m.name == name]
-    if frequency is not None:
-        results = [m for m in results if m.frequency == frequency]
-    if is_current is not None:
-        results = [m for m in results if m.is_current == is_current]
-    if start_date is not None:
-        results = [m for m in results if (m.start_date and str(m.start_date) == start_date)]
-    if end_date is not None:
-        results = [m for m in results if (m.end_date and str(m.end_date) == end_date)]
-
-    return results
+    medications[key] = MedicationRecord(**dict(med))
+    medication_order[key] = next(_seq)
+    _reindex(medication_index, key, set(), _medication_keys(medications[key]))
+    return _json(medications[key], status_code=201)
+
+@app.get("/medications", response_model=None, responses={200: {"model": List[MedicationRead]}})
+async def list_medications(filters: Annotated[MedicationFilters, Query()]):
+    results = _query(medication_index, medications, medication_order, dict(filters))
+    return _json(results)
 
 @app.get("/medications/{medication_id}", response_model=MedicationRead)
-def get_medication(medication_id: UUID):
+async def get_medication(medication_id: IdPath):
+    medication_id = medication_id.lower()
     if medication_id not in medications:
         raise HTTPException(status_code=404, detail="Medication not found")
-    return medications[medication_id]
+    return _json(medications[medication_id])
 
 @app.patch("/medications/{medication_id}", response_model=MedicationRead)
-def update_medication(medication_id: UUID, update: MedicationUpdate):
+async def update_medication(medication_id: IdPath, update: MedicationUpdate):
+    medication_id = medication_id.lower()
     if medication_id not in medications:
         raise HTTPException(status_code=404, detail="Medication not found")
-    stored = medications[medication_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    medications[medication_id] = MedicationRead(**stored)
-    return medications[medication_id]
+    previous = medications[medication_id]
+    changes = _changes(update, MEDICATION_NON_NULL)
+    changes["updated_at"] = utcnow()
+    record = replace(previous, **changes)
+    old_keys, new_keys = _medication_keys(previous), _medication_keys(record)
+    medications[medication_id] = record
+    _reindex(medication_index, medication_id, old_keys, new_keys)
+    return _json(medications[medication_id])
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to the Person/Address API. See /docs for OpenAPI UI."}
 
 # -----------------------------------------------------------------------------
@@ -284,4 +430,19 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    # Production: gunicorn -k uvicorn.workers.UvicornWorker -w $WORKERS main:app
+    # TODO: the in-memory stores above are per-process, so workers do not share
+    # state. Keep WORKERS=1 until they move to a shared store (e.g. Redis).
+    if os.environ.get("DEV"):
+        uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=int(os.environ.get("WORKERS", 1)),
+            # "auto" picks uvloop/httptools when installed (uvloop is skipped on Windows)
+            loop="auto",
+            http="auto",
+            log_level="warning",
+        )
@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Canonical UUID text form; ids are compared as lowercase strings, not UUID objects
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+UUIDStr = Annotated[str, StringConstraints(pattern=UUID_PATTERN, to_lower=True)]
+
+
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time; the timestamp policy for every resource."""
+    return datetime.now(timezone.utc)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from . import utcnow
+
 
 class AddressBase(BaseModel):
     id: UUID = Field(
@@ -39,6 +42,8 @@ class AddressBase(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -108,12 +113,12 @@ class AddressUpdate(BaseModel):
 
 class AddressRead(AddressBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -134,3 +139,25 @@ class AddressRead(AddressBase):
             ]
         }
     }
+
+
+class AddressFilters(BaseModel):
+    """Query filters for listing addresses; unset fields are ignored."""
+    street: Optional[str] = Field(None, description="Filter by street")
+    city: Optional[str] = Field(None, description="Filter by city")
+    state: Optional[str] = Field(None, description="Filter by state/region")
+    postal_code: Optional[str] = Field(None, description="Filter by postal code")
+    country: Optional[str] = Field(None, description="Filter by country")
+
+
+@dataclass(slots=True, frozen=True)
+class AddressRecord:
+    """In-memory storage form of AddressRead; built without running pydantic validation."""
+    id: UUID
+    street: str
+    city: str
+    state: Optional[str]
+    postal_code: Optional[str]
+    country: str
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)
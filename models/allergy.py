@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import Optional, Literal
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from . import UUIDStr, utcnow
+
 AllergySeverity = Literal["mild", "moderate", "severe"]
 AllergyType = Literal["drug", "food", "environment", "other"]
 
@@ -48,6 +51,8 @@ class AllergyBase(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -83,12 +88,12 @@ class AllergyUpdate(BaseModel):
 
 class AllergyRead(AllergyBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -110,3 +115,26 @@ class AllergyRead(AllergyBase):
             ]
         }
     }
+
+
+class AllergyFilters(BaseModel):
+    """Query filters for listing allergies; unset fields are ignored."""
+    person_id: Optional[UUIDStr] = Field(None, description="Filter by person_id")
+    allergen: Optional[str] = Field(None, description="Filter by allergen")
+    allergy_type: Optional[str] = Field(None, description="Filter by allergy_type")
+    severity: Optional[str] = Field(None, description="Filter by severity")
+    noted_date: Optional[str] = Field(None, description="Filter by noted_date (YYYY-MM-DD)")
+
+
+@dataclass(slots=True, frozen=True)
+class AllergyRecord:
+    """In-memory storage form of AllergyRead; built without running pydantic validation."""
+    id: UUID
+    person_id: UUID
+    allergen: str
+    allergy_type: AllergyType
+    reaction: Optional[str]
+    severity: AllergySeverity
+    noted_date: Optional[date]
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import Optional, Literal
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from . import UUIDStr, utcnow
+
 DoseUnit = Literal["mg", "mcg", "g", "mL", "units", "puffs", "drops"]
 Frequency = Literal["once_daily", "twice_daily", "three_times_daily", "as_needed", "other"]
 
@@ -55,6 +58,8 @@ class MedicationBase(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -101,12 +106,12 @@ class MedicationUpdate(BaseModel):
 
 class MedicationRead(MedicationBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -131,3 +136,30 @@ class MedicationRead(MedicationBase):
             ]
         }
     }
+
+
+class MedicationFilters(BaseModel):
+    """Query filters for listing medications; unset fields are ignored."""
+    person_id: Optional[UUIDStr] = Field(None, description="Filter by person_id")
+    name: Optional[str] = Field(None, description="Filter by medication name")
+    frequency: Optional[str] = Field(None, description="Filter by frequency")
+    is_current: Optional[bool] = Field(None, description="Filter by current flag")
+    start_date: Optional[str] = Field(None, description="Filter by exact start_date (YYYY-MM-DD)")
+    end_date: Optional[str] = Field(None, description="Filter by exact end_date (YYYY-MM-DD)")
+
+
+@dataclass(slots=True, frozen=True)
+class MedicationRecord:
+    """In-memory storage form of MedicationRead; built without running pydantic validation."""
+    id: UUID
+    person_id: UUID
+    name: str
+    dose: Optional[float]
+    dose_unit: Optional[DoseUnit]
+    frequency: Frequency
+    instructions: Optional[str]
+    start_date: Optional[date]
+    end_date: Optional[date]
+    is_current: bool
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)
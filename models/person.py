@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Optional, List, Annotated
 from uuid import UUID, uuid4
 from datetime import date, datetime
 from pydantic import BaseModel, Field, EmailStr, StringConstraints
 
+from . import utcnow
 from .address import AddressBase
 
 # Columbia UNI: 2–3 lowercase letters + 1–4 digits (e.g., abc1234)
 UNIType = Annotated[str, StringConstraints(pattern=r"^[a-z]{2,3}\d{1,4}$")]
 
-
 class PersonBase(BaseModel):
     uni: UNIType = Field(
         ...,
@@ -62,6 +63,8 @@ class PersonBase(BaseModel):
     )
 
     model_config = {
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -172,12 +175,12 @@ class PersonRead(PersonBase):
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -209,3 +212,30 @@ class PersonRead(PersonBase):
             ]
         }
     }
+
+
+class PersonFilters(BaseModel):
+    """Query filters for listing persons; unset fields are ignored."""
+    uni: Optional[str] = Field(None, description="Filter by Columbia UNI")
+    first_name: Optional[str] = Field(None, description="Filter by first name")
+    last_name: Optional[str] = Field(None, description="Filter by last name")
+    email: Optional[str] = Field(None, description="Filter by email")
+    phone: Optional[str] = Field(None, description="Filter by phone number")
+    birth_date: Optional[str] = Field(None, description="Filter by date of birth (YYYY-MM-DD)")
+    city: Optional[str] = Field(None, description="Filter by city of at least one address")
+    country: Optional[str] = Field(None, description="Filter by country of at least one address")
+
+
+@dataclass(slots=True, frozen=True)
+class PersonRecord:
+    """In-memory storage form of PersonRead; built without running pydantic validation."""
+    uni: str
+    first_name: str
+    last_name: str
+    email: str
+    phone: Optional[str]
+    birth_date: Optional[date]
+    addresses: List[AddressBase]
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)